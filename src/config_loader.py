@@ -0,0 +1,123 @@
+# config_loader.py
+
+import copy as _copy
+import json
+import os
+from stat import S_IMODE
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+
+_CACHE_MAXSIZE = 100
+
+# abs path -> (mtime_ns, size, parsed config), least recently used first
+_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+
+
+def load_config(path, copy: bool = False) -> Dict[str, Any]:
+    """
+    Load a YAML or JSON configuration file, reusing earlier parses.
+
+    Parsed files are cached by absolute path and revalidated against the
+    file's mtime and size, so an edited file is always re-read.
+    YAML files also get a JSON sidecar (<file>.json) that is preferred
+    over the YAML source while it records the source's exact mtime and size.
+    The cached dict is returned as-is and must be treated as read-only,
+    unless copy is set.
+
+    Args:
+        path (str | Path): Path to a .yaml/.yml or .json file.
+        copy (bool): Return a deep copy the caller may mutate freely.
+
+    Returns:
+        dict: The parsed configuration.
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+
+    entry = _cache.get(key)
+    if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        _cache.move_to_end(key)
+        data = entry[2]
+    else:
+        data = _parse(key)
+        _cache[key] = (stat.st_mtime_ns, stat.st_size, data)
+        _cache.move_to_end(key)
+        if len(_cache) > _CACHE_MAXSIZE:
+            _cache.popitem(last=False)
+
+    return _copy.deepcopy(data) if copy else data
+
+
+def _parse(path: str) -> Dict[str, Any]:
+    if path.endswith(".json"):
+        return _read_json(path)
+
+    sidecar = path + ".json"
+    source = os.stat(path)
+    try:
+        stored = _read_json(sidecar)
+        if stored["mtime_ns"] == source.st_mtime_ns and stored["size"] == source.st_size:
+            return stored["data"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass  # missing, unreadable or old-format sidecar, fall back to YAML
+
+    data = _read_yaml(path)
+    _write_sidecar(sidecar, data, source)
+    return data
+
+
+def _read_yaml(path: str) -> Dict[str, Any]:
+    # PyYAML is imported here, not at module level: it is slow to import
+    # and not needed at all while JSON sidecars are fresh.
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader
+
+    # Hand the parser raw bytes; it detects the encoding itself, which
+    # skips Python's text decoding layer.
+    with open(path, "rb") as f:
+        return yaml.load(f.read(), Loader=SafeLoader) or {}
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_sidecar(path: str, data: Dict[str, Any], source: os.stat_result) -> None:
+    """
+    Store a JSON copy of parsed YAML so later loads skip the YAML parser.
+
+    The source's mtime_ns and size are stored alongside the data; the
+    sidecar is only used while both match exactly. It is written to a
+    temp file and moved into place, so readers never see a partial file.
+    Skipped when the data does not survive a JSON round trip unchanged
+    (e.g. non-string keys or dates), and when the directory is read-only.
+    """
+    tmp = None
+    try:
+        if json.loads(json.dumps(data)) != data:
+            return
+        encoded = json.dumps(
+            {"mtime_ns": source.st_mtime_ns, "size": source.st_size, "data": data},
+            ensure_ascii=False,
+        )
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(encoded)
+        # mkstemp creates the file 0600; readable by whoever can read the source
+        os.chmod(tmp, S_IMODE(source.st_mode))
+        os.replace(tmp, path)
+        tmp = None
+    except (OSError, TypeError, ValueError):
+        pass
+    finally:
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
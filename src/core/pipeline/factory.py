@@ -1,5 +1,8 @@
 # core/pipeline_factory.py
 
+import os
+from functools import lru_cache
+
 from engines.registry import ENGINE_REGISTRY
 import jsonschema
 from config_loader import load_config
@@ -9,8 +12,24 @@ def validate_pipeline_config(config_data, schema_file):
     """
     Loads config (YAML or JSON), validate, builds pipelines with registry.
     """
-    schema = load_config(schema_file)
-    jsonschema.validate(instance=config_data, schema=schema)
+    path = os.path.abspath(schema_file)
+    stat = os.stat(path)
+    validator = _schema_validator(path, stat.st_mtime_ns, stat.st_size)
+    error = jsonschema.exceptions.best_match(validator.iter_errors(config_data))
+    if error is not None:
+        raise error
+
+
+@lru_cache(maxsize=16)
+def _schema_validator(schema_path, mtime_ns, size):
+    """
+    Checked, ready-to-use validator per schema file version.
+    Same checks as jsonschema.validate, without rebuilding the validator each call.
+    """
+    schema = load_config(schema_path)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
 
 
 def create_pipelines_from_config(config_file, alphabet, schema_file):
@@ -19,11 +38,44 @@ def create_pipelines_from_config(config_file, alphabet, schema_file):
     """
     config = load_config(config_file)
     validate_pipeline_config(config, schema_file)
-    
+
+    builders = _compiled_pipelines(os.path.abspath(config_file), config)
+
     pipelines = {}
-    for cipher_name, steps in config["pipelines"].items():
-        engines = [
-            ENGINE_REGISTRY[step["engine"]](step, alphabet) for step in steps
-        ]
-        pipelines[cipher_name] = engines
+    for cipher_name, build in builders.items():
+        pipelines[cipher_name] = build(alphabet)
     return pipelines
+
+
+# abs path -> (config it was compiled from, builders per pipeline name)
+_compiled = {}
+
+
+def _compiled_pipelines(config_path, config):
+    """
+    Compiled builders per pipeline name for the config that was just validated.
+    load_config returns the same object while the file is unchanged, so
+    repeated builds reuse the builders and skip the registry lookups.
+    """
+    entry = _compiled.get(config_path)
+    if entry is None or entry[0] is not config:
+        entry = (config, {
+            cipher_name: compile_pipeline(steps)
+            for cipher_name, steps in config["pipelines"].items()
+        })
+        _compiled[config_path] = entry
+    return entry[1]
+
+
+def compile_pipeline(steps):
+    """
+    Resolve the registry factory for every step once.
+    Returns a callable that builds the pipeline's engines for an alphabet,
+    so repeated builds skip the registry lookups.
+    """
+    resolved = [(ENGINE_REGISTRY[step["engine"]], step) for step in steps]
+
+    def build(alphabet):
+        return [factory(step, alphabet) for factory, step in resolved]
+
+    return build
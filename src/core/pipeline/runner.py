@@ -4,16 +4,123 @@ class CipherPipeline:
     """
     A pipeline that apply a list of engines on a text.
     Every engine have to implement get_substitution_for_position(pos)
+
+    Engines with a get_static_translation_table() are handled only when
+    the pipeline is built: consecutive ones are fused into one table.
+    The rest may expose get_periodic_translation_tables() or
+    get_block_translation_tables(); the pipeline then runs them through
+    str.translate instead of the per-character loop.
+    Engines flagged is_position_independent are asked for their map once.
+
+    Every path gives the same result as the per-position loop.
+
+    Example:
+        >>> from lib.alphabet.base_alphabet import Alphabet
+        >>> from engines.rot import StaticRot, AlbertiRot, VigenereRot
+        >>> from engines.plugboard import PlugboardEngine
+        >>> a = Alphabet.from_unicode_ranges("latin", [(65, 90)])
+        >>> engines = [
+        ...     StaticRot(a, 3),
+        ...     PlugboardEngine({'A': 'B', 'B': 'A', 'Q': 'QU'}),
+        ...     StaticRot(a, 5),
+        ...     AlbertiRot(a, 1, 2, 3),
+        ...     VigenereRot(a, "KEY"),
+        ...     PlugboardEngine({1: 2, 'AB': 'C', 'X': 'Y'}),
+        ... ]
+        >>> def per_position(engines, text):
+        ...     for engine in engines:
+        ...         text = ''.join([
+        ...             engine.get_substitution_for_position(i).get(char, char)
+        ...             for i, char in enumerate(text)
+        ...         ])
+        ...     return text
+        >>> pipeline = CipherPipeline(engines)
+        >>> len(pipeline._stages)  # the first three engines fuse into one table
+        4
+        >>> text = "ATTACK AT DAWN, NOT AT DUSK! \x01"
+        >>> pipeline.encrypt(text) == per_position(engines, text)
+        True
+        >>> pipeline.encrypt(text * 7) == per_position(engines, text * 7)
+        True
     """
 
     def __init__(self, engines):
         self.engines = engines
+        self._stages = self._fuse(engines)
 
     def encrypt(self, text):
-        for engine in self.engines:
-            result = []
-            for i, char in enumerate(text):
-                sub_map = engine.get_substitution_for_position(i)
-                result.append(sub_map.get(char, char))
-            text = ''.join(result)
+        for table, engine in self._stages:
+            text = text.translate(table) if table is not None else self._apply(engine, text)
         return text
+
+    @classmethod
+    def _fuse(cls, engines):
+        """
+        Group the engines into stages of (fused_table, None) or (None, engine).
+        """
+        stages = []
+        for engine in engines:
+            get_table = getattr(engine, "get_static_translation_table", None)
+            table = get_table() if get_table else None
+            if table is None:
+                stages.append((None, engine))
+            elif stages and stages[-1][0] is not None:
+                stages[-1] = (cls._compose(stages[-1][0], table), None)
+            else:
+                stages.append((table, None))
+        return stages
+
+    @staticmethod
+    def _compose(first, second):
+        """
+        Return one translate table equivalent to translating with first, then second.
+
+        Example:
+            >>> first = {ord('A'): 'BC', ord('D'): None, ord('E'): ord('F')}
+            >>> second = {ord('B'): 'X', ord('F'): 'G', ord('D'): 'Z'}
+            >>> table = CipherPipeline._compose(first, second)
+            >>> "ABDEF".translate(table) == "ABDEF".translate(first).translate(second)
+            True
+        """
+        composed = {}
+        for key, value in first.items():
+            if value is None:
+                composed[key] = None
+            else:
+                composed[key] = (chr(value) if isinstance(value, int) else value).translate(second)
+        for key, value in second.items():
+            composed.setdefault(key, value)
+        return composed
+
+    @staticmethod
+    def _apply(engine, text):
+        get_tables = getattr(engine, "get_periodic_translation_tables", None)
+        tables = get_tables() if get_tables else None
+        if tables:
+            # Translate each interleaved strand text[i::period] with its own table
+            period = len(tables)
+            result = list(text)
+            for offset, table in enumerate(tables[:len(text)]):
+                result[offset::period] = text[offset::period].translate(table)
+            return ''.join(result)
+
+        get_blocks = getattr(engine, "get_block_translation_tables", None)
+        blocks = get_blocks() if get_blocks else None
+        if blocks:
+            # Translate each contiguous run of block_size chars with its block's table;
+            # only the blocks the text spans are ever looked up
+            block_size, table_for_block = blocks
+            return ''.join([
+                text[start:start + block_size].translate(table_for_block(block))
+                for block, start in enumerate(range(0, len(text), block_size))
+            ])
+
+        if getattr(engine, "is_position_independent", False):
+            lookup = engine.get_substitution_for_position(0).get
+            return ''.join([lookup(char, char) for char in text])
+
+        result = []
+        for i, char in enumerate(text):
+            sub_map = engine.get_substitution_for_position(i)
+            result.append(sub_map.get(char, char))
+        return ''.join(result)
@@ -5,8 +5,23 @@ class PlugboardEngine:
     Simple plugboard (static substitutionalmap).
     """
 
+    is_position_independent = True
+
     def __init__(self, substitution_map):
         self._map = substitution_map
+        # Only single-character str keys can ever match a char of the text;
+        # int keys (e.g. YAML digits) would be read as code points by translate.
+        # Non-str values keep the per-character path, which inserts them as-is.
+        if all(isinstance(v, str) for v in substitution_map.values()):
+            self._table = {
+                ord(k): v for k, v in substitution_map.items()
+                if isinstance(k, str) and len(k) == 1
+            }
+        else:
+            self._table = None
 
     def get_substitution_for_position(self, pos):
         return self._map
+
+    def get_static_translation_table(self):
+        return self._table
@@ -1,12 +1,32 @@
 # engines/registry.py
 
-from engines.rot import StaticRot, AlbertiRot, VigenereRot
-from engines.plugboard import PlugboardEngine
+# Engine modules are imported on first use, so building a pipeline only
+# loads the engines it actually names.
+
+
+def _static_rot(cfg, alpha):
+    from engines.rot import StaticRot
+    return StaticRot(alpha, cfg["shift"])
+
+
+def _alberti_rot(cfg, alpha):
+    from engines.rot import AlbertiRot
+    return AlbertiRot(alpha, cfg["initial_shift"], cfg["shift_interval"], cfg["shift_step"])
+
+
+def _vigenere_rot(cfg, alpha):
+    from engines.rot import VigenereRot
+    return VigenereRot(alpha, cfg["key_stream"])
+
+
+def _plugboard(cfg, _):
+    from engines.plugboard import PlugboardEngine
+    return PlugboardEngine(cfg["map"])
+
 
 ENGINE_REGISTRY = {
-    "static_rot": lambda cfg, alpha: StaticRot(alpha, cfg["shift"]),
-    "alberti_rot": lambda cfg, alpha: AlbertiRot(alpha, cfg["initial_shift"], cfg["shift_interval"], cfg["shift_step"]),
-    "vigenere_rot": lambda cfg, alpha: VigenereRot(alpha, cfg["key_stream"]),
-    "plugboard": lambda cfg, _: PlugboardEngine(cfg["map"]),
+    "static_rot": _static_rot,
+    "alberti_rot": _alberti_rot,
+    "vigenere_rot": _vigenere_rot,
+    "plugboard": _plugboard,
 }
-
@@ -8,44 +8,80 @@ class AbstractRotEngine(ABC):
     This can be reused by Caesar, ROT13, Vigenère, Alberti, etc.
     """
 
+    is_position_independent = False
+
     def __init__(self, alphabet):
         self.alphabet = alphabet
 
     
     @abstractmethod
-    def get_substitution_map(self, pos: int):
+    def get_substitution_for_position(self, pos: int):
         """ Returns substitutionan map depanding on positions in the text"""
         ...
 
+    def get_static_translation_table(self):
+        """ Returns a str.translate table if the map never depends on position, else None"""
+        return None
+
+    def get_periodic_translation_tables(self):
+        """ Returns one str.translate table per position in the period, or None"""
+        return None
+
+    def get_block_translation_tables(self):
+        """ Returns (block_size, table_for_block) if each run of block_size chars shares one table, else None"""
+        return None
+
 
 #Skriva kommentarer
 class StaticRot(AbstractRotEngine):
+    is_position_independent = True
+
     def __init__(self, alphabet, shift):
         super().__init__(alphabet)
-        self._map = alphabet.substitution_map(alphabet * shift)
+        self.shift = shift
+        # Only the code-point table is built up front; the char map is
+        # rarely needed once the pipeline translates with the table.
+        self._table = alphabet.table_for_shift(shift)
 
     def get_substitution_for_position(self, pos):
-        return self._map
+        return self.alphabet.submap_for_shift(self.shift)
+
+    def get_static_translation_table(self):
+        return self._table
 
 
 class AlbertiRot(AbstractRotEngine):
     def __init__(self, alphabet, initial_shift, shift_interval, shift_step):
         super().__init__(alphabet)
         self.initial_shift = initial_shift
+        self._length = len(alphabet)
         self.shift_interval = shift_interval
         self.shift_step = shift_step
 
-    def get_substitution_for_position(self, pos):
+    def _shift_for_position(self, pos):
         shift_count = (pos // self.shift_interval) * self.shift_step
-        total_shift = (self.initial_shift + shift_count) % len(self.alphabet)
-        return self.alphabet.substitution_map(self.alphabet * total_shift)
+        return (self.initial_shift + shift_count) % self._length
+
+    def get_substitution_for_position(self, pos):
+        return self.alphabet.submap_for_shift(self._shift_for_position(pos))
+
+    def _table_for_block(self, block):
+        # The shift is constant within an interval; tables are memoized by the alphabet
+        return self.alphabet.table_for_shift(self._shift_for_position(block * self.shift_interval))
+
+    def get_block_translation_tables(self):
+        return self.shift_interval, self._table_for_block
 
 
 class VigenereRot(AbstractRotEngine):
     def __init__(self, alphabet, key_stream):
         super().__init__(alphabet)
         self.key_stream = [alphabet.index(char) for char in key_stream]
+        self._period = len(self.key_stream)
+        self._tables = [alphabet.table_for_shift(shift) for shift in self.key_stream]
 
     def get_substitution_for_position(self, pos):
-        shift = self.key_stream[pos % len(self.key_stream)]
-        return self.alphabet.substitution_map(self.alphabet * shift)
+        return self.alphabet.submap_for_shift(self.key_stream[pos % self._period])
+
+    def get_periodic_translation_tables(self):
+        return self._tables
@@ -1,6 +1,11 @@
-from dataclasses import dataclass
-from typing import List, Tuple
+import os
+from array import array
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from itertools import chain
+from typing import Dict, Iterator, List, Tuple
 
+from lib.math.rotation_math import unique_rotation
 from lib.sequences.sequence import Sequence
 
 
@@ -17,20 +22,198 @@ class Alphabet:
         >>> a.name
         'basic_latin'
         >>> a.sequence.data[:3]
-        ['A', 'B', 'C']
+        'ABC'
+        >>> a[0], len(a)
+        ('A', 26)
     """
     name: str
     sequence: Sequence[str]
+    _rot_cache: Dict[int, 'Alphabet'] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _submap_cache: Dict[int, Dict[str, str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _table_cache: Dict[int, Dict[int, int]] = field(default_factory=dict, init=False, repr=False, compare=False)
 
 
     @classmethod
     def from_unicode_ranges(cls, name: str, ranges: List[Tuple[int, int]], extras: List[int] = []) -> 'Alphabet':
-        chars = [
-            chr(code)
-            for start, end in ranges
-            for code in range(start, end + 1)
-        ] + [chr(code) for code in extras]
-        sequence = Sequence(chars)
-        sequence.validate_unique()
-        return cls(name=name, sequence=sequence)
+        codes = chain(
+            chain.from_iterable(range(start, end + 1) for start, end in ranges),
+            extras,
+        )
+        _validate_disjoint(ranges, extras)
+        return cls(name=name, sequence=Sequence(''.join(map(chr, codes))))
 
+
+    @classmethod
+    def from_config(cls, name: str, config_path: str) -> 'Alphabet':
+        """
+        Load a named alphabet from a charsets file (see config/charsets.yaml).
+
+        Alphabets are immutable, so one instance is shared per
+        (name, config file) until the file changes on disk.
+        """
+        path = os.path.abspath(config_path)
+        stat = os.stat(path)
+        return _alphabet_from_config(cls, name, path, stat.st_mtime_ns, stat.st_size)
+
+
+    def __len__(self):
+        return self._length
+
+
+    @cached_property
+    def _length(self) -> int:
+        # Read on every shift lookup; saves two nested __len__ calls each time
+        return len(self.sequence.data)
+
+
+    def __iter__(self):
+        return iter(self.sequence)
+
+
+    def __getitem__(self, index):
+        return self.sequence[index]
+
+
+    def index(self, char: str) -> int:
+        """
+        Position of char in the alphabet (O(1), see Sequence.index_of).
+
+        Example:
+            >>> Alphabet.from_unicode_ranges("abc", [(65, 67)]).index('C')
+            2
+        """
+        try:
+            return self.sequence.index_of(char)
+        except ValueError:
+            raise ValueError(f"{char!r} is not in alphabet '{self.name}'.") from None
+
+
+    def __mul__(self, shift: int) -> 'Alphabet':
+        """
+        Return the alphabet rotated left by shift positions (memoized).
+
+        Example:
+            >>> a = Alphabet.from_unicode_ranges("abc", [(65, 67)])
+            >>> (a * 1).sequence.data
+            'BCA'
+        """
+        offset = shift % self._length
+        if offset == 0:
+            return self
+        rotated = self._rot_cache.get(offset)
+        if rotated is None:
+            rotated = type(self)(name=self.name, sequence=Sequence(self._rotated_chars(offset)))
+            self._rot_cache[offset] = rotated
+        return rotated
+
+
+    @cached_property
+    def _doubled(self):
+        return self.sequence.data * 2
+
+
+    def _rotated_chars(self, offset: int) -> str:
+        # One slice of the doubled buffer instead of two slices and a concat
+        return self._doubled[offset:offset + self._length]
+
+
+    @cached_property
+    def _codepoints(self) -> array:
+        # Code points for translate tables, so no ord() per table build
+        return array('L', map(ord, self.sequence.data))
+
+
+    @cached_property
+    def _doubled_codepoints(self) -> array:
+        return self._codepoints * 2
+
+
+    def rotations(self, step: int = 1) -> Iterator['Alphabet']:
+        """
+        Yield each distinct rotation reached by repeatedly shifting step positions.
+
+        The cycle length is known up front (len // gcd(step, len)),
+        so no bookkeeping of visited offsets is needed.
+
+        Example:
+            >>> a = Alphabet.from_unicode_ranges("abcd", [(65, 68)])
+            >>> [r.sequence.data for r in a.rotations(2)]
+            ['ABCD', 'CDAB']
+        """
+        for i in range(unique_rotation(self._length, step)):
+            yield self * (i * step)
+
+
+    def substitution_map(self, other: 'Alphabet') -> Dict[str, str]:
+        """
+        Map each character of this alphabet to the character at the same position in other.
+        """
+        return dict(zip(self.sequence, other.sequence))
+
+
+    def submap_for_shift(self, shift: int) -> Dict[str, str]:
+        """
+        Return the (memoized) substitution map for a ROT of the given shift.
+
+        Example:
+            >>> a = Alphabet.from_unicode_ranges("abc", [(65, 67)])
+            >>> a.submap_for_shift(1)
+            {'A': 'B', 'B': 'C', 'C': 'A'}
+        """
+        offset = shift % self._length
+        sub_map = self._submap_cache.get(offset)
+        if sub_map is None:
+            # Zip against the rotated chars directly; no Alphabet per shift
+            sub_map = dict(zip(self.sequence, self._rotated_chars(offset)))
+            self._submap_cache[offset] = sub_map
+        return sub_map
+
+
+    def translation_table(self, other: 'Alphabet') -> Dict[int, int]:
+        """
+        Like substitution_map, but keyed by code point as str.translate expects.
+
+        Example:
+            >>> a = Alphabet.from_unicode_ranges("abc", [(65, 67)])
+            >>> "CAB".translate(a.translation_table(a * 1))
+            'ABC'
+        """
+        return dict(zip(self._codepoints, other._codepoints))
+
+
+    def table_for_shift(self, shift: int) -> Dict[int, int]:
+        """
+        Return the (memoized) str.translate table for a ROT of the given shift.
+        """
+        offset = shift % self._length
+        table = self._table_cache.get(offset)
+        if table is None:
+            table = dict(zip(self._codepoints, self._doubled_codepoints[offset:offset + self._length]))
+            self._table_cache[offset] = table
+        return table
+
+
+def _validate_disjoint(ranges: List[Tuple[int, int]], extras: List[int]) -> None:
+    """
+    Same guarantee as Sequence.validate_unique, checked on the code-point
+    intervals instead of a set of every character.
+    """
+    intervals = sorted(
+        [(start, end) for start, end in ranges if start <= end]
+        + [(code, code) for code in extras]
+    )
+    for (_, prev_end), (start, _) in zip(intervals, intervals[1:]):
+        if start <= prev_end:
+            raise ValueError("Sequence contains duplicate values.")
+
+
+@lru_cache(maxsize=32)
+def _alphabet_from_config(cls, name: str, path: str, mtime_ns: int, size: int) -> Alphabet:
+    from config_loader import load_config  # only needed when loading from config
+
+    alphabets = load_config(path).get("alphabets", {})
+    if name not in alphabets:
+        raise ValueError(f"Alphabet '{name}' is not defined in {path}.")
+    spec = alphabets[name]
+    ranges = [tuple(r) for r in spec.get("ranges", [])]
+    return cls.from_unicode_ranges(name, ranges, spec.get("extras", []))
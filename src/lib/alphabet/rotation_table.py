@@ -1,5 +1,6 @@
-from typing import List, Dict
+from typing import List
 from lib.alphabet.base_alphabet import Alphabet
+from lib.math.rotation_math import rotation_offsets
 from lib.sequences.sequence import Sequence
 
 
@@ -7,27 +8,41 @@ class RotationTable:
     """
     Rotation-based substitution table (optimized).
 
-    Stores rotation rows as lists only, and uses base sequence for lookup.
-    More memory-efficient than mapping-based versions.
+    Every row is a window into one doubled copy of the base sequence,
+    so only row offsets are stored, and uses base sequence for lookup.
+    Memory is O(n) instead of O(n^2) for n rows of n characters.
 
     Example:
         >>> base = Alphabet.from_unicode_ranges("latin", [(65, 90)])
         >>> table = RotationTable(base, step=1)
         >>> table.lookup('A', 'B')  # ROT 1
         'B'
+        >>> table[2][:3]
+        'CDE'
     """
 
 
     def __init__(self, base_alphabet: Alphabet, step: int = 1):
         self.base = base_alphabet
         self.step = step
-        self.rows: Dict[int, List[str]] = {
-            i: row for i, row in enumerate(self.base.sequence.rotate_generator(step))
-        }
+        self._length = len(base_alphabet)
+        self._doubled = base_alphabet.sequence.data * 2
+        # Row i starts at offset (i * step) % n of the doubled buffer
+        self._offsets = rotation_offsets(self._length, step)
+        self._row_count = len(self._offsets)
 
 
-    def __getitem__(self, index: int) -> List[str]:
-        return self.rows[index % len(self.rows)]
+    @property
+    def rows(self) -> List[str]:
+        """
+        Materialize all rows (mainly for inspection; lookups never need this).
+        """
+        return [self[i] for i in range(self._row_count)]
+
+
+    def __getitem__(self, index: int) -> str:
+        offset = self._offsets[index % self._row_count]
+        return self._doubled[offset:offset + self._length]
 
 
     def lookup(self, plain: str, key: str) -> str:
@@ -36,5 +51,4 @@ class RotationTable:
         """
         row_index = self.base.sequence.index_of(key)
         col_index = self.base.sequence.index_of(plain)
-        return self[row_index][col_index]
-
+        return self._doubled[self._offsets[row_index % self._row_count] + col_index]
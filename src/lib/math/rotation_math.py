@@ -1,4 +1,5 @@
-from typing import Dict
+from typing import Dict, Tuple
+from functools import lru_cache
 from math import gcd
 
 def normalize_shift(shift: int, length: int) -> int:
@@ -6,17 +7,19 @@ def normalize_shift(shift: int, length: int) -> int:
     Normalize a shift value to wrap within a sequence of given length.
 
     Ensures the shift is correctly bounded to the sequence's index space,
-    supporting both positive and negative values.
+    supporting both positive and negative values. The result is always
+    the canonical non-negative shift (a left shift of 1 equals a right
+    shift of length - 1), so a single modulo suffices.
 
     Example:
         >>> normalize_shift(4, 3)
         1
         >>> normalize_shift(-1, 3)
-        -1
+        2
     """
     if length <= 0:
         raise ValueError("Length must be positive.")
-    return shift % length if shift >= 0 else -(abs(shift) % length)
+    return shift % length
 
 
 def unique_rotation(length: int, step: int) -> int:
@@ -38,6 +41,25 @@ def unique_rotation(length: int, step: int) -> int:
     return length // gcd(abs(step), length)
 
 
+@lru_cache(maxsize=128)
+def rotation_offsets(length: int, step: int) -> Tuple[int, ...]:
+    """
+    Offsets visited when rotating a sequence of given length step by step,
+    one per unique rotation, starting at 0.
+
+    The trip count is known up front (see unique_rotation), so no
+    cycle detection is needed. Results are cached per (length, step),
+    so repeated generators skip the gcd and offset arithmetic.
+
+    Example:
+        >>> rotation_offsets(6, 2)
+        (0, 2, 4)
+        >>> rotation_offsets(3, -1)
+        (0, 2, 1)
+    """
+    return tuple((i * step) % length for i in range(unique_rotation(length, step)))
+
+
 def valid_rotations(length: int) -> Dict[int, int]:
     """
     Generate a dictionary mapping each valid step (1 to length-1)
@@ -45,9 +67,11 @@ def valid_rotations(length: int) -> Dict[int, int]:
 
     Example:
         >>> valid_rotations(6)
-        {1: 6, 5: 6, 2: 3, 4: 3, 3: 2}
+        {1: 6, 2: 3, 3: 2, 4: 3, 5: 6}
     """
     if length <= 0:
         raise ValueError("Length must be positive.")
-    return {step: unique_rotation(length, step) for step in range(1, length)}
+    # Inputs are validated once above, so call gcd directly rather than
+    # re-checking them through unique_rotation for every step.
+    return {step: length // gcd(step, length) for step in range(1, length)}
 
@@ -1,5 +1,7 @@
-from typing import List, TypeVar, Generic, Iterator
+import typing
+from typing import Dict, List, Optional, TypeVar, Generic, Iterator
 from dataclasses import dataclass
+from functools import cached_property
 
 
 from .sequence_tool import SequenceTool  # lokal import
@@ -14,20 +16,44 @@ class Sequence(Generic[T]):
     """
     Immutable sequence wrapper with transformation support.
 
+    data may be a list or a packed sequence (str for characters,
+    array.array for numbers); rotations preserve the storage type.
+
     Example:
         >>> s = Sequence(['A', 'B', 'C'])
         >>> s.rotate(1).data
         ['C', 'A', 'B']
+        >>> s.rotate(3) is s
+        True
     """
-    data: List[T]
+    data: typing.Sequence[T]
 
 
     def rotate(self, shift: int) -> 'Sequence[T]':
+        if self.data and shift % len(self.data) == 0:
+            return self  # immutable, so a full-cycle rotation is just self
         return Sequence(SequenceTool.rotate(self.data, shift))
 
 
     def index_of(self, value: T) -> int:
-        return self.data.index(value)
+        positions = self._positions
+        if positions is not None:
+            try:
+                return positions[value]
+            except KeyError:
+                raise ValueError(f"{value!r} is not in sequence.") from None
+            except TypeError:
+                pass  # unhashable value, scan instead
+        try:
+            return self.data.index(value)
+        except (ValueError, TypeError):
+            raise ValueError(f"{value!r} is not in sequence.") from None
+
+
+    @cached_property
+    def _positions(self) -> Optional[Dict[T, int]]:
+        # Built once, O(1) lookups after; None for unhashable values
+        return SequenceTool.first_positions(self.data)
 
 
     def move_to_front(self, elements: List[T]) -> Iterator['Sequence[T]']:
@@ -1,7 +1,6 @@
-from typing import Callable, Iterable, Iterator, List, TypeVar
-import warnings
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TypeVar
 
-from lib.math.rotation_math import normalize_shift, unique_rotation
+from lib.math.rotation_math import normalize_shift, rotation_offsets
 
 
 T = TypeVar("T")
@@ -17,23 +16,31 @@ class SequenceTool:
     """
 
     @staticmethod
-    def rotate(seq: List[T], shift: int) -> List[T]:
+    def rotate(seq: Sequence[T], shift: int) -> Sequence[T]:
         """
         Rotate a sequence by a given shift.
 
+        Works on any sliceable sequence and keeps its type, so packed
+        storage (str, array.array for numbers) rotates with C-level copies.
+
         Example:
             >>> SequenceTool.rotate(['A', 'B', 'C'], -1)
             ['B', 'C', 'A']
+            >>> SequenceTool.rotate('ABC', 1)
+            'CAB'
+            >>> from array import array
+            >>> SequenceTool.rotate(array('q', [1, 2, 3]), 1)
+            array('q', [3, 1, 2])
         """
         if not seq:
             raise ValueError("Cannot rotate an empty sequence.")
         length = len(seq)
         normalized_shift = normalize_shift(shift, length)
-        return seq[-normalized_shift:] + seq[:-normalized_shift] if normalized_shift else list(seq)
+        return seq[-normalized_shift:] + seq[:-normalized_shift] if normalized_shift else seq[:]
 
 
     @staticmethod
-    def rotate_generator(seq: List[T], step: int = 1) -> Iterator[List[T]]:
+    def rotate_generator(seq: Sequence[T], step: int = 1) -> Iterator[Sequence[T]]:
         """
         Generate all distinct rotations by a given step.
 
@@ -50,17 +57,11 @@ class SequenceTool:
         length = len(seq)
         norm_step = normalize_shift(step, length)
 
-        expected = unique_rotation(length, norm_step)
-
-        seen = set()
-        current = 0
-        while current not in seen:
-            seen.add(current)
-            yield SequenceTool.rotate(seq, current)
-            current = (current + norm_step) % length
-
-        if len(seen) != expected:
-            warnings.warn("Generated fewer unique rotations than expected.")
+        # Every rotation is one slice of a single doubled buffer
+        doubled = seq + seq
+        for offset in rotation_offsets(length, norm_step):
+            start = (length - offset) % length
+            yield doubled[start:start + length]
 
 
     @staticmethod
@@ -72,38 +73,86 @@ class SequenceTool:
             >>> def gen(i): return [chr(65 + (j + i) % 3) for j in range(3)]
             >>> SequenceTool.from_generator(3, gen)
             [['A', 'B', 'C'], ['B', 'C', 'A'], ['C', 'A', 'B']]
+            >>> SequenceTool.from_generator(2, gen, mode='mirror')
+            [['C', 'B', 'A'], ['A', 'C', 'B']]
+        """
+        return list(SequenceTool.iter_from_generator(n, generator_func, mode))
+
+
+    @staticmethod
+    def iter_from_generator(n: int, generator_func: Callable[[int], List[T]], mode: str = 'default') -> Iterator[List[T]]:
+        """
+        Lazy variant of from_generator: rows are produced one at a time,
+        so only the current row needs to be held in memory.
+
+        Example:
+            >>> rows = SequenceTool.iter_from_generator(3, lambda i: [i] * 2)
+            >>> next(rows)
+            [0, 0]
         """
         if n <= 0:
             raise ValueError("Cannot generate zero or negative number of sequences.")
         if n == 1:
             raise ValueError("Generating only one sequence is discouraged.")
 
-        result = [generator_func(i) for i in range(n)]
         if mode == 'mirror':
-            return [list(reversed(seq)) for seq in result]
-        return result
+            # Reverse while generating instead of in a second pass over the rows
+            return (list(reversed(generator_func(i))) for i in range(n))
+        return (generator_func(i) for i in range(n))
 
 
     @staticmethod
-    def move_elements_to_front(seq: List[T], elements: List[T]) -> Iterator[List[T]]:
+    def move_elements_to_front(seq: Sequence[T], elements: List[T]) -> Iterator[Sequence[T]]:
         """
         Yield new sequences with specified elements moved to front.
 
+        Each result is built from slices, so it keeps the input's type.
+
         Example:
             >>> list(SequenceTool.move_elements_to_front(['A', 'B', 'C'], ['C']))
             [['C', 'A', 'B']]
+            >>> list(SequenceTool.move_elements_to_front('ABC', ['B', 'X']))
+            ['BAC']
+            >>> list(SequenceTool.move_elements_to_front([[1], [2]], [[2]]))
+            [[[2], [1]]]
         """
         if not seq:
             raise ValueError("Cannot manipulate an empty sequence.")
+        positions = SequenceTool.first_positions(seq)
         for element in elements:
-            if element in seq:
-                temp = list(seq)
-                temp.remove(element)
-                yield [element] + temp
+            try:
+                i = positions.get(element) if positions is not None else seq.index(element)
+            except TypeError:  # unhashable element
+                i = next((j for j, value in enumerate(seq) if value == element), None)
+            except ValueError:
+                i = None
+            if i is not None:
+                yield seq[i:i + 1] + seq[:i] + seq[i + 1:]
+
+
+    @staticmethod
+    def first_positions(seq: Sequence[T]) -> Optional[Dict[T, int]]:
+        """
+        Map each value to the index of its first occurrence.
+
+        Zipping in reverse lets earlier occurrences overwrite later ones.
+        Returns None when the values are unhashable (e.g. rows of lists),
+        so callers fall back to scanning.
+
+        Example:
+            >>> SequenceTool.first_positions('ABA')
+            {'A': 0, 'B': 1}
+            >>> SequenceTool.first_positions([[1], [2]]) is None
+            True
+        """
+        try:
+            return dict(zip(reversed(seq), range(len(seq) - 1, -1, -1)))
+        except TypeError:
+            return None
 
 
     @staticmethod
-    def index_of(seq: List[T], value: T) -> int:
+    def index_of(seq: Sequence[T], value: T) -> int:
         """
         Get index of a value in a sequence.
 
@@ -1,8 +1,17 @@
 # text_manipulator.py
 
+import re
+
 from message_bit import MessageBit
 
 
+# Deletes every non-alphabetic Latin-1 character in a single str.translate pass
+_LATIN1_NONALPHA = str.maketrans('', '', ''.join(chr(i) for i in range(256) if not chr(i).isalpha()))
+
+# Removes runs of characters that can never be letters (non-word, digits, '_')
+_NONLETTER_RE = re.compile(r'[\W\d_]+')
+
+
 class TextManipulator:
     """
     Utility class for text preprocessing.
@@ -31,7 +40,13 @@ class TextManipulator:
             text = text.upper()
 
         if not allow_nonalpha:
-            text = ''.join(char for char in text if char.isalpha())
+            if text.isascii() or max(text) <= '\xff':
+                text = text.translate(_LATIN1_NONALPHA)
+            else:
+                text = _NONLETTER_RE.sub('', text)
+                if not text.isalpha():
+                    # Rare leftovers such as superscript digits
+                    text = ''.join(char for char in text if char.isalpha())
 
         return MessageBit(text)
 
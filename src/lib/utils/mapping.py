@@ -45,17 +45,13 @@ class MappingMixin(Generic[T]):
         if len(others) == 1:
             return dict(zip(reference, others[0]))
         else:
-            return {
-                reference[i]: tuple(seq[i] for seq in others)
-                for i in range(len(reference))
-            }
+            # zip(*others) transposes the sequences into per-index tuples in C
+            return dict(zip(reference, zip(*others)))
 
 
-"""
-future feature
-def invert_mapping(mapping: Dict[T, T]) -> Dict[T, T]:
-    """
-    # Invert a simple 1:1 mapping.
-    """
-    return {v: k for k, v in mapping.items()}
-"""
+# future feature
+# def invert_mapping(mapping: Dict[T, T]) -> Dict[T, T]:
+#     """
+#     Invert a simple 1:1 mapping.
+#     """
+#     return {v: k for k, v in mapping.items()}
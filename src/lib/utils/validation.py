@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+from itertools import repeat
 
 
 def fail_fast_typecheck(
@@ -16,6 +18,13 @@ def fail_fast_typecheck(
     Raises:
         TypeError: If any element is not of the expected type.
     """
+    if not isinstance(data, Sequence):
+        data = list(data)  # may be a one-shot iterator; it is scanned twice on failure
+
+    # Fast path: map() runs the isinstance checks in C; details only on failure
+    if all(map(isinstance, data, repeat(expected_type))):
+        return
+
     invalid_items = [
         (i, item) for i, item in enumerate(data)
         if not isinstance(item, expected_type)